@@ -9,23 +9,39 @@ a trainer across games and rematches.
 from __future__ import annotations
 
 import argparse
-import json
+import gzip
 import logging
+import multiprocessing
 import re
 import sys
+import threading
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import quote, urljoin
 
+import lxml.html
+import orjson
 import requests
-from bs4 import BeautifulSoup
-from bs4.element import NavigableString, Tag
+import requests_cache
+from lxml import etree
+from lxml.html import HtmlElement
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_URL = "https://bulbapedia.bulbagarden.net/w/api.php"
 BASE_URL = "https://bulbapedia.bulbagarden.net"
 DEFAULT_DELAY = 1.2
+DEFAULT_WORKERS = 4
+# MediaWiki accepts at most 50 titles per query for regular clients.
+TITLE_BATCH_SIZE = 50
+# Cached API responses are reused for a week before being fetched again.
+CACHE_EXPIRE_AFTER = 7 * 24 * 3600
+# Transient statuses retried with exponential backoff (Retry-After is honoured).
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
@@ -35,7 +51,13 @@ DEFAULT_USER_AGENT = (
 HEADING_TAGS = {"h2", "h3", "h4", "h5"}
 
 REFERENCE_RE = re.compile(r"\[(?:note\s*\d+|\d+)\]")
-WHITESPACE_RE = re.compile(r"\s+")
+
+# Class prefixes of footnote and tooltip markup hidden from cell text.
+HIDDEN_CLASS_PREFIXES = ("reference", "tooltip")
+
+# Elements whose text is never part of the rendered content (ruby
+# annotations, scripts and styles), mirroring BeautifulSoup's get_text.
+TEXTLESS_TAGS = {"rp", "rt", "script", "style", "template"}
 
 # Keywords we expect in team tables. If none are present, the table is
 # likely unrelated (e.g. biographies or trivia tables).
@@ -50,6 +72,7 @@ TABLE_KEYWORDS = (
     "item",
     "items",
 )
+TABLE_KEYWORD_RE = re.compile("|".join(re.escape(keyword) for keyword in TABLE_KEYWORDS))
 
 DISALLOWED_TITLE_KEYWORDS = (
     "(anime)",
@@ -71,14 +94,26 @@ PREFERRED_TITLE_KEYWORDS = (
     "champion",
 )
 
+# A single alternation over all title keywords, so scoring a search result
+# scans its title once instead of once per keyword.
+TITLE_KEYWORD_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in PREFERRED_TITLE_KEYWORDS + DISALLOWED_TITLE_KEYWORDS)
+)
+
 
 @dataclass
 class TeamTable:
-    """Representation of a roster table on Bulbapedia."""
+    """Representation of a roster table on Bulbapedia.
+
+    ``rows`` is stored column-wise: each column name maps to the list of
+    cell values for that column, one entry per table row.
+    """
+
+    __slots__ = ("title", "columns", "rows")
 
     title: Optional[str]
     columns: List[str]
-    rows: List[Dict[str, str]]
+    rows: Dict[str, List[str]]
 
     def to_dict(self) -> Dict[str, object]:
         return {
@@ -92,15 +127,85 @@ class BulbapediaError(RuntimeError):
     """Exception raised when a Bulbapedia request or parse fails."""
 
 
+class _RateLimitedAdapter(HTTPAdapter):
+    """Transport adapter that waits for the rate limit before each request.
+
+    Mounting the limiter on the adapter means responses served from the
+    local cache never reach it and are returned without any delay.
+    """
+
+    def __init__(self, wait: Callable[[], None], **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        self._wait = wait
+
+    def send(self, request: requests.PreparedRequest, **kwargs: object) -> requests.Response:
+        self._wait()
+        return super().send(request, **kwargs)
+
+
+class _RateLimitedRetry(Retry):
+    """Retry policy that also waits for the rate limit before each retry.
+
+    urllib3 retries inside ``HTTPAdapter.send``, past the adapter's own wait,
+    and its first backoff is zero, so a retried request would otherwise go
+    out immediately after the failed one.
+    """
+
+    def __init__(self, *args: object, wait: Optional[Callable[[], None]] = None, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self._wait = wait
+
+    def new(self, **kwargs: object) -> "_RateLimitedRetry":
+        retry = super().new(**kwargs)
+        retry._wait = self._wait
+        return retry
+
+    def sleep(self, response: Optional[object] = None) -> None:
+        super().sleep(response)
+        if self._wait is not None:
+            self._wait()
+
+
 class BulbapediaTrainerScraper:
     """Scrape trainer tables from Bulbapedia using the MediaWiki API."""
 
-    def __init__(self, *, user_agent: str, delay: float, timeout: float = 30.0) -> None:
-        self.session = requests.Session()
+    def __init__(
+        self,
+        *,
+        user_agent: str,
+        delay: float,
+        timeout: float = 30.0,
+        cache_path: Optional[Path] = None,
+        parse_executor: Optional[Executor] = None,
+        workers: int = DEFAULT_WORKERS,
+    ) -> None:
+        if cache_path is not None:
+            self.session = requests_cache.CachedSession(
+                str(cache_path),
+                backend="sqlite",
+                expire_after=CACHE_EXPIRE_AFTER,
+                # Fall back to an expired copy if the API errors or is unreachable.
+                stale_if_error=True,
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({"User-Agent": user_agent})
+        retries = _RateLimitedRetry(
+            total=3, backoff_factor=1, status_forcelist=RETRY_STATUSES, wait=self._respect_rate_limit
+        )
+        # One pooled connection per worker thread, so none are discarded.
+        adapter = _RateLimitedAdapter(
+            self._respect_rate_limit, pool_maxsize=max(1, workers), max_retries=retries
+        )
+        self.session.mount("https://", adapter)
         self.delay = delay
         self.timeout = timeout
+        # Optional (process) pool that runs extract_sections off the fetching threads.
+        self.parse_executor = parse_executor
         self._last_request = 0.0
+        self._rate_lock = threading.Lock()
+        # Requested name -> canonical page title, or None if no such page.
+        self._resolved_titles: Dict[str, Optional[str]] = {}
 
     # ------------------------------------------------------------------
     # HTTP helpers
@@ -108,13 +213,15 @@ class BulbapediaTrainerScraper:
     def _respect_rate_limit(self) -> None:
         if self.delay <= 0:
             return
-        elapsed = time.monotonic() - self._last_request
-        if elapsed < self.delay:
-            time.sleep(self.delay - elapsed)
-        self._last_request = time.monotonic()
+        # Worker threads share one request clock so the delay still spaces
+        # out every request sent to Bulbapedia, not just those of a thread.
+        with self._rate_lock:
+            elapsed = time.monotonic() - self._last_request
+            if elapsed < self.delay:
+                time.sleep(self.delay - elapsed)
+            self._last_request = time.monotonic()
 
     def _get(self, params: Dict[str, object]) -> requests.Response:
-        self._respect_rate_limit()
         response = self.session.get(API_URL, params=params, timeout=self.timeout)
         response.raise_for_status()
         return response
@@ -123,13 +230,13 @@ class BulbapediaTrainerScraper:
     # Bulbapedia lookups
     # ------------------------------------------------------------------
     def _score_title(self, title: str) -> int:
-        lowered = title.lower()
+        matched = {match.group() for match in TITLE_KEYWORD_RE.finditer(title.lower())}
         score = 0
         if "(" not in title:
             score += 100
-        if any(keyword in lowered for keyword in PREFERRED_TITLE_KEYWORDS):
+        if not matched.isdisjoint(PREFERRED_TITLE_KEYWORDS):
             score += 60
-        if any(bad in lowered for bad in DISALLOWED_TITLE_KEYWORDS):
+        if not matched.isdisjoint(DISALLOWED_TITLE_KEYWORDS):
             score -= 200
         return score
 
@@ -145,17 +252,53 @@ class BulbapediaTrainerScraper:
             response = self._get(params)
         except requests.RequestException as exc:  # pragma: no cover - network failure
             raise BulbapediaError(f"Search request failed for '{name}': {exc}") from exc
-        data = response.json()
+        data = orjson.loads(response.content)
         candidates = data[1] if isinstance(data, list) and len(data) >= 2 else []
         if not candidates:
             return None
         scored = sorted(((self._score_title(title), title) for title in candidates), reverse=True)
         return scored[0][1]
 
-    def _fetch_page(self, name: str) -> Tuple[str, Dict[str, object], str]:
+    def resolve_titles(self, names: Iterable[str]) -> None:
+        """Resolve the page titles for ``names`` in batched queries.
+
+        A single ``action=query`` request follows normalization and redirects
+        for up to ``TITLE_BATCH_SIZE`` names and reports missing pages, so
+        later lookups can skip parse requests that are bound to fail.
+        """
+
+        pending = [name for name in dict.fromkeys(names) if name not in self._resolved_titles and "|" not in name]
+        for start in range(0, len(pending), TITLE_BATCH_SIZE):
+            batch = pending[start : start + TITLE_BATCH_SIZE]
+            params = {
+                "action": "query",
+                "titles": "|".join(batch),
+                "redirects": 1,
+                "format": "json",
+                "formatversion": 2,
+            }
+            try:
+                response = self._get(params)
+            except requests.RequestException as exc:  # pragma: no cover - network failure
+                # Unresolved names simply fall back to per-page lookups.
+                logging.warning("Title lookup failed for %d trainers: %s", len(batch), exc)
+                continue
+            query = orjson.loads(response.content).get("query", {})
+            normalized = {item["from"]: item["to"] for item in query.get("normalized", [])}
+            redirects = {item["from"]: item["to"] for item in query.get("redirects", [])}
+            pages = {page["title"]: page for page in query.get("pages", [])}
+            for name in batch:
+                title = normalized.get(name, name)
+                title = redirects.get(title, title)
+                page = pages.get(title)
+                if page is None:
+                    continue
+                self._resolved_titles[name] = None if page.get("missing") or page.get("invalid") else title
+
+    def _request_parse(self, page: str) -> Dict[str, object]:
         params = {
             "action": "parse",
-            "page": name,
+            "page": page,
             "format": "json",
             "formatversion": 2,
             "redirects": 1,
@@ -164,19 +307,20 @@ class BulbapediaTrainerScraper:
         try:
             response = self._get(params)
         except requests.RequestException as exc:  # pragma: no cover - network failure
-            raise BulbapediaError(f"Request failed for '{name}': {exc}") from exc
-        data = response.json()
-        if "error" in data:
+            raise BulbapediaError(f"Request failed for '{page}': {exc}") from exc
+        return orjson.loads(response.content)
+
+    def _fetch_page(self, name: str) -> Tuple[str, Dict[str, object], str]:
+        page = self._resolved_titles.get(name, name)
+        # A batched lookup that found no page means parsing would only fail,
+        # so go straight to searching for an alternative title.
+        data = self._request_parse(page) if page is not None else None
+        if data is None or "error" in data:
             alt_title = self._search_alternative_title(name)
             if not alt_title:
                 raise BulbapediaError(f"No Bulbapedia page found for '{name}'")
             logging.debug("Retrying '%s' using alternative title '%s'", name, alt_title)
-            params["page"] = alt_title
-            try:
-                response = self._get(params)
-            except requests.RequestException as exc:  # pragma: no cover - network failure
-                raise BulbapediaError(f"Request failed for '{alt_title}': {exc}") from exc
-            data = response.json()
+            data = self._request_parse(alt_title)
             if "error" in data:
                 raise BulbapediaError(f"Unable to parse Bulbapedia page for '{alt_title}': {data['error']}")
         parse_data = data.get("parse")
@@ -203,7 +347,10 @@ class BulbapediaTrainerScraper:
     # ------------------------------------------------------------------
     def scrape_trainer(self, name: str) -> Dict[str, object]:
         resolved_title, page_meta, html = self._fetch_page(name)
-        sections = extract_sections(html)
+        if self.parse_executor is not None:
+            sections = self.parse_executor.submit(extract_sections, html).result()
+        else:
+            sections = extract_sections(html)
         return {
             "requested_name": name,
             "resolved_title": resolved_title,
@@ -219,54 +366,92 @@ class BulbapediaTrainerScraper:
 def clean_text(text: str) -> str:
     """Normalize whitespace and strip reference footnotes."""
 
-    text = text.replace("\xa0", " ")
-    text = REFERENCE_RE.sub("", text)
-    text = WHITESPACE_RE.sub(" ", text)
-    return text.strip(" ;,\u2020")
+    # Most cells carry no footnote marker, so skip the regex unless one
+    # could be present. str.split() treats non-breaking spaces as
+    # whitespace, so collapsing runs also normalizes them.
+    if "[" in text:
+        text = REFERENCE_RE.sub("", text)
+    return " ".join(text.split()).strip(" ;,\u2020")
+
+
+def _is_hidden(element: HtmlElement) -> bool:
+    """Return ``True`` for footnote markers and tooltips inside table cells."""
+
+    tag = element.tag
+    if tag == "sup":
+        return True
+    if tag not in ("span", "div"):
+        return False
+    return any(cls.startswith(HIDDEN_CLASS_PREFIXES) for cls in element.get("class", "").split())
+
+
+def _stripped_strings(node: HtmlElement, skip_hidden: bool = False) -> Iterator[str]:
+    """Yield the non-empty, stripped text fragments below ``node``."""
+
+    if node.text:
+        text = node.text.strip()
+        if text:
+            yield text
+    for child in node:
+        # Comments and processing instructions have a non-string tag; only
+        # their tail text belongs to the surrounding content.
+        tag = child.tag
+        if isinstance(tag, str) and tag not in TEXTLESS_TAGS and not (skip_hidden and _is_hidden(child)):
+            yield from _stripped_strings(child, skip_hidden)
+        if child.tail:
+            tail = child.tail.strip()
+            if tail:
+                yield tail
+
 
+def element_text(element: HtmlElement) -> str:
+    """Return the text of ``element`` with its fragments joined by spaces."""
 
-def cell_text(cell: Tag) -> str:
+    return " ".join(_stripped_strings(element))
+
+
+def cell_text(cell: HtmlElement) -> str:
     """Extract readable text from a table cell."""
 
-    # Work on a shallow copy so we do not mutate the original soup tree.
-    cloned = BeautifulSoup(str(cell), "html.parser")
-    for tag in cloned.find_all(["sup", "span", "div"]):
-        classes = tag.get("class", [])
-        if tag.name == "sup" or any(cls.startswith("reference") or cls.startswith("tooltip") for cls in classes):
-            tag.decompose()
-    text = cloned.get_text("\n", strip=True)
+    text = "\n".join(_stripped_strings(cell, skip_hidden=True))
     if not text:
         return ""
     parts = [clean_text(part) for part in text.split("\n")]
     return "; ".join(part for part in parts if part)
 
 
-def _consume_spans(row_values: List[str], span_map: Dict[int, Tuple[str, int]], col_idx: int) -> int:
-    while col_idx in span_map:
-        text, remaining = span_map[col_idx]
-        row_values.append(text)
-        remaining -= 1
-        if remaining > 0:
-            span_map[col_idx] = (text, remaining)
-        else:
-            del span_map[col_idx]
+def _consume_spans(row_values: List[str], span_map: List[Optional[List]], col_idx: int) -> int:
+    # span_map is indexed by column; live entries are mutable [text, rows_left]
+    # pairs so they can be counted down in place.
+    size = len(span_map)
+    while col_idx < size:
+        span = span_map[col_idx]
+        if span is None:
+            break
+        row_values.append(span[0])
+        span[1] -= 1
+        if not span[1]:
+            span_map[col_idx] = None
         col_idx += 1
     return col_idx
 
 
-def _parse_row(cells: Iterable[Tag], span_map: Dict[int, Tuple[str, int]]) -> List[str]:
+def _parse_row(cells: Iterable[HtmlElement], span_map: List[Optional[List]]) -> List[str]:
     row_values: List[str] = []
     col_idx = 0
     col_idx = _consume_spans(row_values, span_map, col_idx)
     for cell in cells:
         col_idx = _consume_spans(row_values, span_map, col_idx)
         text = cell_text(cell)
-        colspan = int(cell.get("colspan", 1) or 1)
-        rowspan = int(cell.get("rowspan", 1) or 1)
+        attrs = cell.attrib
+        colspan = int(attrs.get("colspan", 1) or 1)
+        rowspan = int(attrs.get("rowspan", 1) or 1)
+        if rowspan > 1 and col_idx + colspan > len(span_map):
+            span_map.extend([None] * (col_idx + colspan - len(span_map)))
         for offset in range(colspan):
             row_values.append(text)
             if rowspan > 1:
-                span_map[col_idx + offset] = (text, rowspan - 1)
+                span_map[col_idx + offset] = [text, rowspan - 1]
         col_idx += colspan
     _consume_spans(row_values, span_map, col_idx)
     return row_values
@@ -299,19 +484,21 @@ def _normalize_columns(columns: List[str], width: int) -> List[str]:
     return result
 
 
-def parse_table(table: Tag) -> Optional[TeamTable]:
-    span_map: Dict[int, Tuple[str, int]] = {}
+def parse_table(table: HtmlElement) -> Optional[TeamTable]:
+    span_map: List[Optional[List]] = []
     header_rows: List[List[str]] = []
     data_rows: List[List[str]] = []
 
-    for row in table.find_all("tr"):
-        cells = row.find_all(["th", "td"])
+    for row in table.iter("tr"):
+        cells = list(row.iter("th", "td"))
         if not cells:
             continue
-        row_values = [clean_text(value) for value in _parse_row(cells, span_map)]
+        # cell_text already returns cleaned text, including for values carried
+        # down by rowspans, so the row needs no second clean_text pass.
+        row_values = _parse_row(cells, span_map)
         if not any(row_values):
             continue
-        is_header_row = not any(cell.name == "td" for cell in cells)
+        is_header_row = not any(cell.tag == "td" for cell in cells)
         if is_header_row:
             header_rows.append(row_values)
         else:
@@ -328,77 +515,117 @@ def parse_table(table: Tag) -> Optional[TeamTable]:
         header = [f"Column {idx + 1}" for idx in range(width)]
     else:
         header = _normalize_columns(header, width)
-
-    rows: List[Dict[str, str]] = []
+    # Column names repeat across every table of every trainer; intern them so
+    # the scraped results share one string object per distinct name.
+    header = [sys.intern(column) for column in header]
+
+    # Duplicate column names keep the value of their last occurrence.
+    column_index = {name: idx for idx, name in enumerate(header)}
+    rows: Dict[str, List[str]] = {name: [] for name in column_index}
+    row_count = 0
     for row in data_rows:
         padded = row + [""] * (width - len(row))
-        entry = {header[idx]: padded[idx] for idx in range(width)}
-        if any(value for value in entry.values()):
-            rows.append(entry)
+        values = [padded[idx] for idx in column_index.values()]
+        if not any(values):
+            continue
+        for column, value in zip(rows.values(), values):
+            column.append(value)
+        row_count += 1
 
-    if not rows:
+    if not row_count:
         return None
 
-    caption_tag = table.find("caption")
-    title = clean_text(caption_tag.get_text(" ", strip=True)) if caption_tag else None
+    caption_tag = next(table.iter("caption"), None)
+    title = clean_text(element_text(caption_tag)) if caption_tag is not None else None
     return TeamTable(title=title or None, columns=header, rows=rows)
 
 
-def _is_team_table(table: Tag) -> bool:
-    classes = table.get("class", [])
+def _is_team_table(table: HtmlElement) -> bool:
+    classes = table.get("class", "").split()
     if any("navbox" in cls for cls in classes):
         return False
-    header_text = " ".join(cell_text(th).lower() for th in table.find_all("th"))
-    if not header_text:
-        return False
-    return any(keyword in header_text for keyword in TABLE_KEYWORDS)
+    # Only keyword presence matters here, so plain text_content() is enough;
+    # the full cell_text cleanup runs once the table is actually parsed.
+    header_text = " ".join(th.text_content().lower() for th in table.iter("th"))
+    return TABLE_KEYWORD_RE.search(header_text) is not None
 
 
-def _normalize_heading(heading: Tag) -> str:
-    title = heading.get_text(" ", strip=True)
+def _normalize_heading(heading: HtmlElement) -> str:
+    title = element_text(heading)
     title = title.replace("[edit]", "")
     return clean_text(title)
 
 
 def extract_sections(html: str) -> List[Dict[str, object]]:
-    soup = BeautifulSoup(html, "html.parser")
-    container = soup.select_one(".mw-parser-output") or soup
+    if not html.strip():
+        return []
+    try:
+        root = lxml.html.document_fromstring(html)
+    except etree.ParserError:
+        # Comment- or doctype-only markup has no document to parse.
+        return []
+    containers = root.find_class("mw-parser-output")
+    container = containers[0] if containers else root
 
     sections: Dict[Tuple[str, ...], Dict[str, object]] = {}
-    stack: List[Tuple[int, str]] = []
-
-    for element in container.children:
-        if isinstance(element, NavigableString):
-            continue
-        if element.name in HEADING_TAGS:
-            level = int(element.name[1])
+    # Each entry is (level, title, is_pokemon_heading). The heading path and
+    # the Pokémon-section flag only change with the stack, so they are
+    # recomputed on headings rather than for every table.
+    stack: List[Tuple[int, str, bool]] = []
+    current_path: Tuple[str, ...] = ()
+    in_pokemon_section = False
+
+    for element in container:
+        if element.tag in HEADING_TAGS:
+            level = int(element.tag[1])
             title = _normalize_heading(element)
             if not title:
                 continue
             while stack and stack[-1][0] >= level:
                 stack.pop()
-            stack.append((level, title))
-            continue
-        if element.name != "table":
+            stack.append((level, title, level <= 2 and "pokémon" in title.lower()))
+            current_path = tuple(entry[1] for entry in stack)
+            # Only keep tables that fall under a Pokémon heading at level 2 or deeper.
+            in_pokemon_section = any(entry[2] for entry in stack)
             continue
-        if not stack:
+        if element.tag != "table":
             continue
-        # Only keep tables that fall under a Pokémon heading at level 2 or deeper.
-        if not any(level <= 2 and "pokémon" in title.lower() for level, title in stack):
+        if not in_pokemon_section:
             continue
         if not _is_team_table(element):
             continue
         table = parse_table(element)
+        # Drop the parsed subtree right away so large pages do not keep
+        # every roster table alive until the whole page is processed.
+        element.clear()
         if not table:
             continue
-        path = tuple(title for _, title in stack)
-        section = sections.setdefault(path, {"path": list(path), "tables": []})
+        section = sections.get(current_path)
+        if section is None:
+            section = sections[current_path] = {"path": list(current_path), "tables": []}
         section["tables"].append(table.to_dict())
     # Preserve deterministic ordering by sorting paths alphabetically.
     ordered_paths = sorted(sections.keys())
     return [sections[path] for path in ordered_paths]
 
 
+# ----------------------------------------------------------------------
+# File helpers
+# ----------------------------------------------------------------------
+
+def read_json_bytes(path: Path) -> bytes:
+    """Read a JSON file, decompressing it first if it ends in ``.gz``."""
+
+    data = path.read_bytes()
+    return gzip.decompress(data) if path.suffix == ".gz" else data
+
+
+def write_json_bytes(path: Path, data: bytes) -> None:
+    """Write encoded JSON, gzip-compressing it if ``path`` ends in ``.gz``."""
+
+    path.write_bytes(gzip.compress(data) if path.suffix == ".gz" else data)
+
+
 # ----------------------------------------------------------------------
 # Trainer name helpers
 # ----------------------------------------------------------------------
@@ -406,8 +633,7 @@ def extract_sections(html: str) -> List[Dict[str, object]]:
 def load_trainer_names(pokemondb_json: Path) -> List[str]:
     if not pokemondb_json.exists():
         raise FileNotFoundError(f"PokemonDB JSON file not found: {pokemondb_json}")
-    with pokemondb_json.open("r", encoding="utf8") as handle:
-        data = json.load(handle)
+    data = orjson.loads(read_json_bytes(pokemondb_json))
     names = set()
     for game in data.values():
         sections = game.get("sections", [])
@@ -429,13 +655,13 @@ def build_argument_parser() -> argparse.ArgumentParser:
         "--pokemondb-json",
         type=Path,
         default=Path(__file__).with_name("pokemondb_trainers.json"),
-        help="Path to the PokemonDB trainer JSON used to derive trainer names",
+        help="Path to the PokemonDB trainer JSON used to derive trainer names (.gz files are decompressed)",
     )
     parser.add_argument(
         "--output",
         type=Path,
         default=Path(__file__).with_name("bulbapedia_trainers.json"),
-        help="Destination JSON file",
+        help="Destination JSON file (a .gz suffix writes gzip-compressed JSON)",
     )
     parser.add_argument(
         "--delay",
@@ -443,6 +669,18 @@ def build_argument_parser() -> argparse.ArgumentParser:
         default=DEFAULT_DELAY,
         help="Delay between HTTP requests to respect Bulbapedia rate limits",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Number of trainers fetched concurrently (requests are still spaced by --delay)",
+    )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=0,
+        help="Parse pages in a pool of this many processes (0 parses in the fetching threads)",
+    )
     parser.add_argument(
         "--timeout",
         type=float,
@@ -454,6 +692,17 @@ def build_argument_parser() -> argparse.ArgumentParser:
         default=DEFAULT_USER_AGENT,
         help="Custom user agent string",
     )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=Path(__file__).with_name("bulbapedia_cache.sqlite"),
+        help="SQLite file used to cache Bulbapedia API responses between runs",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch fresh responses instead of using the on-disk cache",
+    )
     parser.add_argument(
         "--trainer",
         dest="trainers",
@@ -487,31 +736,55 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 1
 
     if args.trainers:
-        requested = set(args.trainers)
-        missing = requested - set(all_trainers)
+        # Requested names are usually few, so filter them against an index of
+        # the known names instead of scanning the full list.
+        order = {name: index for index, name in enumerate(all_trainers)}
+        requested = dict.fromkeys(args.trainers)
+        missing = [name for name in requested if name not in order]
         if missing:
             logging.warning("%d trainers not present in PokemonDB list: %s", len(missing), ", ".join(sorted(missing)))
-        trainers = [name for name in all_trainers if name in requested]
+        trainers = sorted((name for name in requested if name in order), key=order.__getitem__)
     else:
         trainers = all_trainers
 
     if args.max_trainers is not None:
         trainers = trainers[: args.max_trainers]
 
-    scraper = BulbapediaTrainerScraper(user_agent=args.user_agent, delay=args.delay, timeout=args.timeout)
-
-    results: Dict[str, object] = {}
-    failures: Dict[str, str] = {}
-    for index, trainer_name in enumerate(trainers, start=1):
-        logging.info("[%d/%d] Scraping %s", index, len(trainers), trainer_name)
-        try:
-            results[trainer_name] = scraper.scrape_trainer(trainer_name)
-        except BulbapediaError as exc:
-            logging.warning("Failed to scrape %s: %s", trainer_name, exc)
-            failures[trainer_name] = str(exc)
-        except Exception as exc:  # pragma: no cover - defensive guard
-            logging.exception("Unexpected error while scraping %s", trainer_name)
-            failures[trainer_name] = f"Unexpected error: {exc}"
+    # The pool starts its processes lazily from the scraping threads, and
+    # forking a threaded process can deadlock the child, so spawn them.
+    parse_pool = (
+        ProcessPoolExecutor(max_workers=args.parse_processes, mp_context=multiprocessing.get_context("spawn"))
+        if args.parse_processes > 0
+        else nullcontext()
+    )
+    with parse_pool as parse_executor:
+        scraper = BulbapediaTrainerScraper(
+            user_agent=args.user_agent,
+            delay=args.delay,
+            timeout=args.timeout,
+            cache_path=None if args.no_cache else args.cache,
+            parse_executor=parse_executor,
+            workers=args.workers,
+        )
+
+        logging.info("Resolving Bulbapedia titles for %d trainers", len(trainers))
+        scraper.resolve_titles(trainers)
+
+        results: Dict[str, object] = {}
+        failures: Dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            futures = {executor.submit(scraper.scrape_trainer, name): name for name in trainers}
+            for index, future in enumerate(as_completed(futures), start=1):
+                trainer_name = futures[future]
+                logging.info("[%d/%d] Processed %s", index, len(trainers), trainer_name)
+                try:
+                    results[trainer_name] = future.result()
+                except BulbapediaError as exc:
+                    logging.warning("Failed to scrape %s: %s", trainer_name, exc)
+                    failures[trainer_name] = str(exc)
+                except Exception as exc:  # pragma: no cover - defensive guard
+                    logging.exception("Unexpected error while scraping %s", trainer_name)
+                    failures[trainer_name] = f"Unexpected error: {exc}"
 
     payload = {
         "source": {
@@ -525,9 +798,10 @@ def main(argv: Optional[List[str]] = None) -> int:
         payload["failures"] = failures
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    with args.output.open("w", encoding="utf8") as handle:
-        json.dump(payload, handle, ensure_ascii=False, indent=2, sort_keys=True)
-        handle.write("\n")
+    write_json_bytes(
+        args.output,
+        orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE),
+    )
 
     logging.info("Wrote %d trainer entries to %s", len(results), args.output)
     if failures:
@@ -8,7 +8,7 @@ headers = {
 }
 
 response = requests.get(url, headers=headers, timeout=30)
-soup = BeautifulSoup(response.text, "html.parser")
+soup = BeautifulSoup(response.text, "lxml")
 
 print("=" * 80)
 print("All H2 headings:")
@@ -8,7 +8,7 @@ headers = {
 }
 
 response = requests.get(url, headers=headers, timeout=30)
-soup = BeautifulSoup(response.text, "html.parser")
+soup = BeautifulSoup(response.text, "lxml")
 
 # Get first trainer card
 first_h2 = soup.find("h2")
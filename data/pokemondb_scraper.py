@@ -12,26 +12,45 @@ when running it outside of development to respect the site's terms of use.
 from __future__ import annotations
 
 import argparse
-import json
+import multiprocessing
 import re
+import threading
 import time
 from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Union
 from urllib.parse import urljoin
 
+import lxml.html
+import orjson
 import requests
-from bs4 import BeautifulSoup
-from bs4.element import NavigableString, Tag
+import requests_cache
+from bs4.element import Tag
+from lxml import etree
+from lxml.html import HtmlElement
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 BASE_URL = "https://pokemondb.net"
 TRAINER_PATH_SUFFIX = "/gymleaders-elitefour"
 DEFAULT_DELAY = 1.5
+DEFAULT_WORKERS = 4
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Cached game pages are reused for a week before being fetched again.
+CACHE_EXPIRE_AFTER = 7 * 24 * 3600
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
 )
+# "(Alolan Form) ..." style prefixes on a Pokemon's name line.
+VARIATION_RE = re.compile(r"^\((.+?)\)")
+LEVEL_RE = re.compile(r"Level\s+(\d+)", re.IGNORECASE)
+# Footnote markers such as "[note 1]" (matched after whitespace is collapsed).
+NOTE_RE = re.compile(r"\[note \d+\]")
 
 # Known game slugs on PokemonDB
 # Format: (display_name, slug, custom_path_suffix)
@@ -59,11 +78,23 @@ KNOWN_GAMES = [
     ("Scarlet/Violet", "scarlet-violet", None),
 ]
 
+# Tags element_text skips, as get_text() does.
+TEXTLESS_TAGS = {"rp", "rt", "script", "style", "template"}
+
+# Headings that title a trainer card on the legacy overview pages.
+TRAINER_HEADING_TAGS = ("h3", "h4", "h5")
+# Headings inside a card that title the team table following them.
+TEAM_HEADING_TAGS = frozenset({"h4", "h5"})
+# Container classes whose grid-col children are the trainer cards.
+GRID_ROW_CLASSES = frozenset({"grid-row", "grid", "row"})
+
 
 @dataclass
 class TeamEntry:
     """A single team listing for a trainer."""
 
+    __slots__ = ("title", "columns", "rows")
+
     title: Optional[str]
     columns: List[str]
     rows: List[dict]
@@ -73,26 +104,33 @@ class TeamEntry:
 class Trainer:
     """Structured representation of a trainer on a trainer overview page."""
 
+    __slots__ = ("name", "subtitle", "description", "teams")
+
     name: str
     subtitle: Optional[str]
     description: Optional[str]
     teams: List[TeamEntry]
 
 
+# Labels, levels and type names repeat across every card and table.
+@lru_cache(maxsize=8192)
 def clean_text(text: str) -> str:
     """Collapse whitespace and strip extraneous footnote markers."""
 
     collapsed = " ".join(text.split())
-    return collapsed.replace("[note 1]", "").strip()
+    # Most strings carry no marker; only those pay for the regex and strip.
+    if "[note " not in collapsed:
+        return collapsed
+    return NOTE_RE.sub("", collapsed).strip()
 
 
 def cell_text(cell: Tag) -> str:
     """Extract readable text from a table cell."""
 
-    if cell.find("ul"):
+    if _contains_tag(cell, ("ul",)):
         items = [clean_text(li.get_text(" ", strip=True)) for li in cell.find_all("li")]
         return "; ".join(item for item in items if item)
-    if cell.find("br"):
+    if _contains_tag(cell, ("br",)):
         parts = [clean_text(part) for part in cell.get_text("\n", strip=True).split("\n")]
         return "; ".join(part for part in parts if part)
     return clean_text(cell.get_text(" ", strip=True))
@@ -116,30 +154,41 @@ def parse_table(table: Tag) -> TeamEntry:
     
     tbody = table.find("tbody") or table
     rows = []
-    for row in tbody.find_all("tr", recursive=False):
-        # Skip header rows
-        if row.find_parent("thead"):
-            continue
-        if all(cell.name == "th" for cell in row.find_all(["td", "th"])):
+    # Every row shares tbody's ancestors, so a thead above it rules out all rows.
+    if tbody.find_parent("thead") is not None:
+        return TeamEntry(title=None, columns=headers, rows=rows)
+    for row in tbody.contents:
+        # Text nodes have no name, so this also skips whitespace between rows.
+        if row.name != "tr":
             continue
-            
-        entries = row.find_all(["td", "th"], recursive=False)
+        entries = [cell for cell in row.contents if cell.name in ("td", "th")]
         if not entries:
             continue
-            
-        row_data = {}
-        for idx, entry in enumerate(entries):
-            key = headers[idx] if idx < len(headers) else f"Column {idx + 1}"
-            row_data[key] = cell_text(entry)
-        if row_data:
-            rows.append(row_data)
+        # Skip header rows; a direct td already proves the row is not one.
+        if all(cell.name == "th" for cell in entries) and all(
+            cell.name == "th" for cell in row.find_all(["td", "th"])
+        ):
+            continue
+
+        row_data = dict(zip(headers, map(cell_text, entries)))
+        for idx in range(len(headers), len(entries)):
+            row_data[f"Column {idx + 1}"] = cell_text(entries[idx])
+        rows.append(row_data)
     return TeamEntry(title=None, columns=headers, rows=rows)
 
 
-def parse_trainer_container(container: Tag) -> Trainer:
-    """Parse a single trainer card from the trainer overview page."""
+def parse_trainer_container(container: Tag) -> Optional[Trainer]:
+    """Parse a single trainer card from the trainer overview page.
+
+    Returns ``None`` for containers without a team table of their own.
+    """
 
-    title_tag = container.find(["h3", "h4", "h5"])
+    # Teams only come from direct table children; reject flavour-text
+    # columns before touching the heading or paragraphs.
+    if not any(child.name == "table" for child in container.contents):
+        return None
+
+    title_tag = container.find(TRAINER_HEADING_TAGS)
     if not title_tag:
         raise ValueError("Trainer container missing title heading")
 
@@ -149,31 +198,49 @@ def parse_trainer_container(container: Tag) -> Trainer:
         subtitle_tag.extract()
     name = clean_text(title_tag.get_text(" ", strip=True))
 
+    # One sweep over the direct children collects the description
+    # paragraphs and the team tables with their headings.
     description_parts = []
-    for paragraph in container.find_all("p", recursive=False):
-        text = clean_text(paragraph.get_text(" ", strip=True))
-        if text:
-            description_parts.append(text)
-    description = "\n".join(description_parts) if description_parts else None
-
     teams: List[TeamEntry] = []
     current_title: Optional[str] = None
-    for child in container.children:
-        if isinstance(child, NavigableString):
+    for child in container.contents:
+        tag_name = child.name
+        # Text nodes (strings, comments) are the only children without a name.
+        if tag_name is None:
             continue
-        if child.name in {"h4", "h5"}:
+        if tag_name == "p":
+            text = clean_text(child.get_text(" ", strip=True))
+            if text:
+                description_parts.append(text)
+        elif tag_name in TEAM_HEADING_TAGS:
             current_title = clean_text(child.get_text(" ", strip=True))
-            continue
-        if child.name == "table":
+        elif tag_name == "table":
             team = parse_table(child)
             team.title = current_title
             teams.append(team)
             current_title = None
+    description = "\n".join(description_parts) if description_parts else None
     return Trainer(name=name, subtitle=subtitle, description=description, teams=teams)
 
 
+def _has_class(tag: Tag, names: frozenset[str]) -> bool:
+    # isdisjoint() walks the tag's short class list against the constant set
+    # without allocating anything per tag.
+    classes = tag.get("class")
+    return classes is not None and not names.isdisjoint(classes)
+
+
+def _contains_tag(tag: Tag, names: Iterable[str]) -> bool:
+    # A plain descendant scan: find() builds a new SoupStrainer on every call,
+    # which dominated the card checks that run once per candidate element.
+    for descendant in tag.descendants:
+        if descendant.name in names:
+            return True
+    return False
+
+
 def _has_heading(tag: Tag) -> bool:
-    return bool(tag.find(["h3", "h4", "h5"]))
+    return _contains_tag(tag, TRAINER_HEADING_TAGS)
 
 
 def _class_contains_grid_col(value: object) -> bool:
@@ -191,7 +258,7 @@ def _looks_like_trainer_card(tag: Tag) -> bool:
         return False
     if tag.name in {"table", "tbody", "thead", "tr"}:
         return False
-    if not tag.find("table"):
+    if not _contains_tag(tag, ("table",)):
         return False
     if not _has_heading(tag):
         return False
@@ -202,20 +269,18 @@ def _find_trainer_cards(node: Tag) -> List[Tag]:
     cards: List[Tag] = []
     if not isinstance(node, Tag):
         return cards
-    if node.name == "div":
-        classes = set(node.get("class", []))
-        if "grid-row" in classes or "grid" in classes or "row" in classes:
-            cards.extend(
-                child
-                for child in node.find_all(
-                    "div",
-                    class_=_class_contains_grid_col,
-                    recursive=False,
-                )
-                if _looks_like_trainer_card(child)
+    if node.name == "div" and _has_class(node, GRID_ROW_CLASSES):
+        cards.extend(
+            child
+            for child in node.find_all(
+                "div",
+                class_=_class_contains_grid_col,
+                recursive=False,
             )
-            if cards:
-                return cards
+            if _looks_like_trainer_card(child)
+        )
+        if cards:
+            return cards
     for candidate in node.find_all(_looks_like_trainer_card):
         parent = candidate.find_parent(
             lambda ancestor: isinstance(ancestor, Tag)
@@ -234,104 +299,159 @@ def extract_section_trainers(section_heading: Tag) -> List[Trainer]:
     trainers: List[Trainer] = []
     seen_cards: set[int] = set()
 
-    sibling = section_heading.find_next_sibling()
-    while sibling and not (isinstance(sibling, Tag) and sibling.name == "h2"):
-        if isinstance(sibling, Tag):
-            for card in _find_trainer_cards(sibling):
-                identity = id(card)
-                if identity in seen_cards:
-                    continue
-                seen_cards.add(identity)
-                try:
-                    trainer = parse_trainer_container(card)
-                except ValueError:
-                    continue
-                if trainer.teams:
-                    trainers.append(trainer)
-        sibling = sibling.find_next_sibling()
+    for sibling in section_heading.next_siblings:
+        if not isinstance(sibling, Tag):
+            continue
+        if sibling.name == "h2":
+            break
+        for card in _find_trainer_cards(sibling):
+            identity = id(card)
+            if identity in seen_cards:
+                continue
+            seen_cards.add(identity)
+            try:
+                trainer = parse_trainer_container(card)
+            except ValueError:
+                continue
+            if trainer is not None and trainer.teams:
+                trainers.append(trainer)
     return trainers
 
 
-def parse_trainer_card(card: Tag) -> dict:
+def _stripped_strings(element: HtmlElement) -> Iterator[str]:
+    """Yield each stripped, non-blank text node under ``element`` in order."""
+
+    if element.text:
+        text = element.text.strip()
+        if text:
+            yield text
+    for child in element:
+        # Skip comments themselves but keep their tail text.
+        if isinstance(child.tag, str) and child.tag not in TEXTLESS_TAGS:
+            yield from _stripped_strings(child)
+        if child.tail:
+            tail = child.tail.strip()
+            if tail:
+                yield tail
+
+
+def element_text(element: HtmlElement) -> str:
+    """Equivalent of ``get_text(" ", strip=True)`` for an lxml element."""
+
+    return " ".join(_stripped_strings(element))
+
+
+def _class_xpath(tag: str, class_name: str) -> str:
+    """Return a descendant XPath for ``tag`` elements with ``class_name``."""
+
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# Per-card lookups, compiled once instead of on every call.
+TRAINER_HEAD_XPATH = etree.XPath(_class_xpath("span", "trainer-head"))
+TRAINER_NAME_XPATH = etree.XPath(_class_xpath("span", "ent-name"))
+TRAINER_PKMN_XPATH = etree.XPath(_class_xpath("div", "trainer-pkmn"))
+PKMN_DATA_XPATH = etree.XPath(_class_xpath("span", "infocard-lg-data"))
+PKMN_NAME_XPATH = etree.XPath(_class_xpath("a", "ent-name"))
+PKMN_TYPES_XPATH = etree.XPath(".//a[contains(@class, 'itype')]")
+
+
+def _first_match(xpath: etree.XPath, element: HtmlElement) -> Optional[HtmlElement]:
+    matches = xpath(element)
+    return matches[0] if matches else None
+
+
+_TRAINER_CARD_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' infocard-list-trainer-pkmn ')"
+# Trainer cards of one section: the cards among its $siblings plus the cards
+# nested in any other sibling, in document order.
+SECTION_CARDS_XPATH = etree.XPath(
+    f"$siblings[self::div and {_TRAINER_CARD_CLASS}]"
+    f" | $siblings[not(self::div and {_TRAINER_CARD_CLASS})]/descendant::div[{_TRAINER_CARD_CLASS}]"
+)
+
+
+def parse_trainer_card(card: HtmlElement) -> dict:
     """Parse a trainer infocard to extract name and Pokemon team.
     
     Returns a dict with 'title' (team variation name) and 'pokemon_list'.
     """
     
     # Find trainer name in span.ent-name within the trainer-head
-    trainer_head = card.find("span", class_="trainer-head")
+    trainer_head = _first_match(TRAINER_HEAD_XPATH, card)
     title = None
     
-    if trainer_head:
+    if trainer_head is not None:
         # Get the full text of the trainer head (includes name + variation)
-        full_text = clean_text(trainer_head.get_text(" ", strip=True))
+        full_text = clean_text(element_text(trainer_head))
         
         # The ent-name span contains just the trainer name
-        name_elem = trainer_head.find("span", class_="ent-name")
-        trainer_name = clean_text(name_elem.get_text(" ", strip=True)) if name_elem else "Unknown"
+        name_elem = _first_match(TRAINER_NAME_XPATH, trainer_head)
+        trainer_name = clean_text(element_text(name_elem)) if name_elem is not None else "Unknown"
         
         # Check if there's variation text after the name
         # e.g., full_text might be "Blue(Bulbasaur as starter)Mixed types"
         # and trainer_name is just "Blue"
-        if name_elem and len(full_text) > len(trainer_name):
+        if name_elem is not None and len(full_text) > len(trainer_name):
             # Get the part after the name
             remainder = full_text[len(trainer_name):].strip()
             # Check if it starts with a parenthesis (variation)
             if remainder.startswith("(") and ")" in remainder:
                 # Extract the variation
-                match = re.match(r'^\((.+?)\)', remainder)
+                match = VARIATION_RE.match(remainder)
                 if match:
                     title = match.group(1)
         
-        # Get subtitle (badge name and type specialty)
-        subtitle_parts = []
-        small_tag = trainer_head.find("small")
-        if small_tag:
-            for text in small_tag.stripped_strings:
-                if "type Pokémon" not in text and "Badge" in text:
-                    subtitle_parts.append(text)
-        subtitle = " - ".join(subtitle_parts) if subtitle_parts else None
+        # Get subtitle (badge name and type specialty); usually a single
+        # badge, so join the matches directly rather than via a list
+        small_tag = next(trainer_head.iter("small"), None)
+        subtitle = None
+        if small_tag is not None:
+            subtitle = " - ".join(
+                text
+                for text in _stripped_strings(small_tag)
+                if "type Pokémon" not in text and "Badge" in text
+            ) or None
     else:
         trainer_name = "Unknown"
         subtitle = None
     
     # Extract Pokemon data - look for div.trainer-pkmn elements
-    pokemon_divs = card.find_all("div", class_="trainer-pkmn")
+    pokemon_divs = TRAINER_PKMN_XPATH(card)
     
     pokemon_list = []
     for pkmn_div in pokemon_divs:
         pkmn_data = {}
         
         # Get the data span
-        data_span = pkmn_div.find("span", class_="infocard-lg-data")
-        if not data_span:
+        data_span = _first_match(PKMN_DATA_XPATH, pkmn_div)
+        if data_span is None:
             continue
         
         # Get Pokemon name from the ent-name link
-        name_link = data_span.find("a", class_="ent-name")
-        if name_link:
-            pkmn_data["Pokemon"] = clean_text(name_link.get_text(" ", strip=True))
+        name_link = _first_match(PKMN_NAME_XPATH, data_span)
+        if name_link is not None:
+            pkmn_data["Pokemon"] = clean_text(element_text(name_link))
         
         # Get Pokedex number
-        number_elem = data_span.find("small")
-        if number_elem:
-            number_text = clean_text(number_elem.get_text(" ", strip=True))
+        number_elem = next(data_span.iter("small"), None)
+        if number_elem is not None:
+            number_text = clean_text(element_text(number_elem))
             if number_text.startswith("#"):
                 pkmn_data["Number"] = number_text
         
         # Get level - find the small tag containing "Level"
-        for small in data_span.find_all("small"):
-            text = clean_text(small.get_text(" ", strip=True))
+        for small in data_span.iter("small"):
+            text = clean_text(element_text(small))
             if text.startswith("Level"):
-                level_match = re.search(r'Level\s+(\d+)', text, re.IGNORECASE)
+                level_match = LEVEL_RE.search(text)
                 if level_match:
                     pkmn_data["Level"] = level_match.group(1)
                 break
         
         # Get types
-        type_links = data_span.find_all("a", class_=lambda c: c and "itype" in c)
+        type_links = PKMN_TYPES_XPATH(data_span)
         if type_links:
-            types = [clean_text(t.get_text(" ", strip=True)) for t in type_links]
+            types = [clean_text(element_text(t)) for t in type_links]
             pkmn_data["Type"] = " / ".join(types)
         
         if pkmn_data:
@@ -345,32 +465,35 @@ def parse_trainer_card(card: Tag) -> dict:
     }
 
 
-def parse_game_page(html: str) -> List[dict]:
+def parse_game_page(html: Union[str, bytes]) -> List[dict]:
     """Parse a PokemonDB game trainer page into sectioned trainer data."""
 
-    soup = BeautifulSoup(html, "html.parser")
+    if not html.strip():
+        return []
+    try:
+        root = lxml.html.document_fromstring(html)
+    except etree.ParserError:
+        # A page with only a doctype or comments has no root element.
+        return []
     sections = []
     
     # The structure is: H2 (section like "Gym #1, Pewter City")
     # followed by one or more div.infocard-list-trainer-pkmn containing trainer data
     # Multiple divs = different forms/variations of the same trainer
     
-    for h2 in soup.find_all("h2"):
-        section_name = clean_text(h2.get_text(" ", strip=True))
-        
-        # Find ALL infocard divs that follow this heading (until next h2)
-        trainer_cards = []
-        current = h2.find_next_sibling()
+    for h2 in root.iter("h2"):
+        section_name = clean_text(element_text(h2))
         
-        while current and not (isinstance(current, Tag) and current.name == "h2"):
-            if isinstance(current, Tag):
-                if current.name == "div" and "infocard-list-trainer-pkmn" in current.get("class", []):
-                    trainer_cards.append(current)
-                # Also check for h3 which might indicate team variations
-                elif current.find("div", class_="infocard-list-trainer-pkmn"):
-                    # Sometimes the cards are nested
-                    trainer_cards.extend(current.find_all("div", class_="infocard-list-trainer-pkmn"))
-            current = current.find_next_sibling()
+        # Everything after this heading up to the next h2 is its section
+        siblings = []
+        for current in h2.itersiblings():
+            if current.tag == "h2":
+                break
+            if isinstance(current.tag, str):
+                siblings.append(current)
+        # Cards are usually siblings but sometimes nested; one XPath call
+        # collects both in document order
+        trainer_cards = SECTION_CARDS_XPATH(h2, siblings=siblings)
         
         if trainer_cards:
             # Group cards by trainer name
@@ -424,19 +547,92 @@ def get_game_links(game_filter: Optional[Iterable[str]] = None) -> List[tuple[st
         game_links.append((game_name, url))
     
     if game_filter:
-        desired = {name.lower() for name in game_filter}
+        # One alternation scans each name once instead of once per filter
+        # term; an exact match is just a substring match of the whole name.
+        desired_re = re.compile("|".join(re.escape(name.lower()) for name in game_filter))
         game_links = [
             (name, url) for name, url in game_links 
-            if name.lower() in desired or any(d in name.lower() for d in desired)
+            if desired_re.search(name.lower())
         ]
     
     return game_links
 
 
+class RequestThrottle:
+    """Space out requests issued from several worker threads."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self._last_request = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if self.delay <= 0:
+            return
+        with self._lock:
+            elapsed = time.monotonic() - self._last_request
+            if elapsed < self.delay:
+                time.sleep(self.delay - elapsed)
+            self._last_request = time.monotonic()
+
+
+class _RateLimitedRetry(Retry):
+    """Retry policy that calls ``wait`` before every retry as well.
+
+    Retries run inside the adapter's send(), so they would otherwise
+    bypass the delay.
+    """
+
+    def __init__(self, *args: object, wait: Optional[Callable[[], None]] = None, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self._wait = wait
+
+    def new(self, **kwargs: object) -> "_RateLimitedRetry":
+        retry = super().new(**kwargs)
+        retry._wait = self._wait
+        return retry
+
+    def sleep(self, response: Optional[object] = None) -> None:
+        super().sleep(response)
+        if self._wait is not None:
+            self._wait()
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """Transport adapter that calls ``wait`` before sending each request."""
+
+    def __init__(self, wait: Callable[[], None], **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        self._wait = wait
+
+    def send(self, request: requests.PreparedRequest, **kwargs: object) -> requests.Response:
+        self._wait()
+        return super().send(request, **kwargs)
+
+
+def fetch_game_sections(
+    session: requests.Session,
+    game_name: str,
+    url: str,
+    parse_executor: Optional[Executor] = None,
+) -> Optional[List[dict]]:
+    print(f"Fetching trainer data for {game_name}...", flush=True)
+    try:
+        page_response = session.get(url, timeout=30)
+        page_response.raise_for_status()
+    except requests.RequestException as exc:
+        print(f"  Failed to download {url}: {exc}")
+        return None
+    if parse_executor is not None:
+        return parse_executor.submit(parse_game_page, page_response.content).result()
+    return parse_game_page(page_response.content)
+
+
 def scrape_trainer_data(
     session: requests.Session,
-    delay: float,
     game_filter: Optional[Iterable[str]] = None,
+    workers: int = DEFAULT_WORKERS,
+    parse_executor: Optional[Executor] = None,
 ) -> OrderedDict[str, dict]:
     """Scrape trainer data for every PokemonDB game page."""
 
@@ -447,24 +643,45 @@ def scrape_trainer_data(
         return OrderedDict()
 
     results: OrderedDict[str, dict] = OrderedDict()
-    for game_name, url in game_links:
-        print(f"Fetching trainer data for {game_name}...", flush=True)
-        try:
-            page_response = session.get(url, timeout=30)
-            page_response.raise_for_status()
-        except requests.RequestException as exc:
-            print(f"  Failed to download {url}: {exc}")
-            continue
-        sections = parse_game_page(page_response.text)
-        results[game_name] = {"source": url, "sections": sections}
-        if delay:
-            time.sleep(delay)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [
+            (
+                game_name,
+                url,
+                executor.submit(fetch_game_sections, session, game_name, url, parse_executor),
+            )
+            for game_name, url in game_links
+        ]
+        # Collect in submission order so the output keeps the game ordering.
+        for game_name, url, future in futures:
+            sections = future.result()
+            if sections is not None:
+                results[game_name] = {"source": url, "sections": sections}
     return results
 
 
-def build_session(user_agent: str) -> requests.Session:
-    session = requests.Session()
+def build_session(
+    user_agent: str,
+    delay: float = DEFAULT_DELAY,
+    pool_size: int = DEFAULT_WORKERS,
+    cache_path: Optional[Path] = None,
+) -> requests.Session:
+    if cache_path is not None:
+        session = requests_cache.CachedSession(
+            str(cache_path),
+            backend="sqlite",
+            expire_after=CACHE_EXPIRE_AFTER,
+            # Serve the last copy while PokemonDB is down.
+            stale_if_error=True,
+        )
+    else:
+        session = requests.Session()
     session.headers.update({"User-Agent": user_agent, "Referer": BASE_URL})
+    # The workers share one throttle; cache hits never reach the adapter.
+    wait = RequestThrottle(delay).wait
+    retries = _RateLimitedRetry(total=3, backoff_factor=1, status_forcelist=RETRY_STATUSES, wait=wait)
+    adapter = _RateLimitedAdapter(wait, pool_maxsize=max(1, pool_size), max_retries=retries)
+    session.mount("https://", adapter)
     return session
 
 
@@ -492,14 +709,53 @@ def main() -> None:
         action="append",
         help="Limit scraping to specific game names from the index page.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Number of game pages fetched concurrently (requests are still spaced by --delay)",
+    )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=0,
+        help="Parse pages in a pool of this many processes (0 parses in the fetching threads)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=Path(__file__).with_name("pokemondb_cache.sqlite"),
+        help="SQLite file used to cache PokemonDB pages between runs",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch fresh pages instead of using the on-disk cache",
+    )
     args = parser.parse_args()
 
-    session = build_session(args.user_agent)
-    data = scrape_trainer_data(session=session, delay=args.delay, game_filter=args.game)
+    session = build_session(
+        args.user_agent,
+        delay=args.delay,
+        pool_size=args.workers,
+        cache_path=None if args.no_cache else args.cache,
+    )
+    # Workers start from the fetch threads, so spawn them instead of forking.
+    parse_pool = (
+        ProcessPoolExecutor(max_workers=args.parse_processes, mp_context=multiprocessing.get_context("spawn"))
+        if args.parse_processes > 0
+        else nullcontext()
+    )
+    with parse_pool as parse_executor:
+        data = scrape_trainer_data(
+            session=session,
+            game_filter=args.game,
+            workers=args.workers,
+            parse_executor=parse_executor,
+        )
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    with args.output.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, ensure_ascii=False, indent=2)
+    args.output.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     print(f"Saved trainer data for {len(data)} games to {args.output}")
 